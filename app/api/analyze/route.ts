@@ -1,5 +1,6 @@
-import { NextResponse } from 'next/server'
-import { apiUrls } from '@/lib/config'
+import { revalidateTag } from 'next/cache'
+import { apiUrls, storageCache, dashboardCache } from '@/lib/config'
+import { relayJson, proxyError } from '@/lib/proxy'
 
 // Server-side proxy to call the Railway analyze API
 export async function POST(req: Request) {
@@ -11,36 +12,29 @@ export async function POST(req: Request) {
       }
     })
 
-    let data: any = null
-    try {
-      data = await res.json()
-    } catch {
-      data = { message: 'Upstream returned non-JSON' }
+    if (res.ok) {
+      // A new analysis may have stored an incident and moved processed files, so drop those cached reads
+      for (const tag of [...storageCache.incidents.tags, ...storageCache.order.tags, ...dashboardCache.files.tags]) revalidateTag(tag)
     }
 
-    return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+    return await relayJson(res, { message: 'Upstream returned non-JSON' })
   } catch (err: any) {
-    return NextResponse.json(
-      { 
-        message: 'Analysis failed', 
-        order_id: '',
-        incidents_count: 0,
-        processing_steps: 0,
-        artifacts_generated: false,
-        com_json: {},
-        rca_json: {},
-        spans: [],
-        storage_results: {
-          success: false,
-          artifacts_stored: 0,
-          spans_stored: 0,
-          incident_created: false,
-          order_id: ''
-        },
-        success: false, 
-        error: String(err?.message || err) 
-      },
-      { status: 500 }
-    )
+    return proxyError(err, {
+      message: 'Analysis failed',
+      order_id: '',
+      incidents_count: 0,
+      processing_steps: 0,
+      artifacts_generated: false,
+      com_json: {},
+      rca_json: {},
+      spans: [],
+      storage_results: {
+        success: false,
+        artifacts_stored: 0,
+        spans_stored: 0,
+        incident_created: false,
+        order_id: ''
+      }
+    })
   }
 }
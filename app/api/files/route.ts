@@ -1,27 +1,12 @@
-import { NextResponse } from 'next/server'
-import { apiUrls } from '@/lib/config'
+import { apiUrls, dashboardCache } from '@/lib/config'
+import { relayJson, proxyError } from '@/lib/proxy'
 
 // Server-side proxy to call the Railway files API
 export async function GET(req: Request) {
   try {
-    const res = await fetch(apiUrls.files)
-
-    let data: any = null
-    try {
-      data = await res.json()
-    } catch {
-      data = { files: [] }
-    }
-
-    return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+    const res = await fetch(apiUrls.files, { next: dashboardCache.files })
+    return await relayJson(res, { files: [] })
   } catch (err: any) {
-    return NextResponse.json(
-      { 
-        files: [],
-        success: false, 
-        error: String(err?.message || err) 
-      },
-      { status: 500 }
-    )
+    return proxyError(err, { files: [] })
   }
 }
@@ -1,28 +1,13 @@
-import { NextResponse } from 'next/server'
 import { apiUrls } from '@/lib/config'
+import { relayJson, proxyError } from '@/lib/proxy'
 
 // Server-side proxy to call the Railway health check API
 export async function GET(req: Request) {
   try {
-    const res = await fetch(apiUrls.health)
-
-    let data: any = null
-    try {
-      data = await res.json()
-    } catch {
-      data = { status: 'unhealthy', service: 'Unknown' }
-    }
-
-    return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+    // Never cached: a stale entry would keep reporting a dead backend as healthy
+    const res = await fetch(apiUrls.health, { cache: 'no-store' })
+    return await relayJson(res, { status: 'unhealthy', service: 'Unknown' })
   } catch (err: any) {
-    return NextResponse.json(
-      { 
-        status: 'unhealthy',
-        service: 'Frontend Proxy',
-        success: false, 
-        error: String(err?.message || err) 
-      },
-      { status: 500 }
-    )
+    return proxyError(err, { status: 'unhealthy', service: 'Frontend Proxy' })
   }
 }
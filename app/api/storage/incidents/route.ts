@@ -1,28 +1,12 @@
-import { NextResponse } from 'next/server'
-import { apiUrls } from '@/lib/config'
+import { apiUrls, storageCache } from '@/lib/config'
+import { relayJson, proxyError } from '@/lib/proxy'
 
 // Server-side proxy to call the Railway incidents API
 export async function GET(req: Request) {
   try {
-    const res = await fetch(apiUrls.incidents)
-
-    let data: any = null
-    try {
-      data = await res.json()
-    } catch {
-      data = { incidents: [], count: 0 }
-    }
-
-    return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+    const res = await fetch(apiUrls.incidents, { next: storageCache.incidents })
+    return await relayJson(res, { incidents: [], count: 0 })
   } catch (err: any) {
-    return NextResponse.json(
-      { 
-        incidents: [],
-        count: 0,
-        success: false, 
-        error: String(err?.message || err) 
-      },
-      { status: 500 }
-    )
+    return proxyError(err, { incidents: [], count: 0 })
   }
 }
@@ -1,5 +1,5 @@
-import { NextResponse } from 'next/server'
-import { apiUrls } from '@/lib/config'
+import { apiUrls, storageCache } from '@/lib/config'
+import { relayJson, proxyError } from '@/lib/proxy'
 
 // Server-side proxy to call the Railway order summary API
 export async function GET(
@@ -8,24 +8,9 @@ export async function GET(
 ) {
   try {
     const orderId = params.order_id
-    const res = await fetch(`${apiUrls.order}/${orderId}`)
-
-    let data: any = null
-    try {
-      data = await res.json()
-    } catch {
-      data = { message: 'Failed to parse order data' }
-    }
-
-    return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+    const res = await fetch(`${apiUrls.order}/${orderId}`, { next: storageCache.order })
+    return await relayJson(res, { message: 'Failed to parse order data' })
   } catch (err: any) {
-    return NextResponse.json(
-      { 
-        message: 'Failed to fetch order summary',
-        success: false, 
-        error: String(err?.message || err) 
-      },
-      { status: 500 }
-    )
+    return proxyError(err, { message: 'Failed to fetch order summary' })
   }
 }
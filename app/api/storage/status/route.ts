@@ -1,29 +1,16 @@
-import { NextResponse } from 'next/server'
 import { apiUrls } from '@/lib/config'
+import { relayJson, proxyError } from '@/lib/proxy'
 
 // Server-side proxy to call the Railway storage status API
 export async function GET(req: Request) {
   try {
     const res = await fetch(apiUrls.storageStatus)
-
-    let data: any = null
-    try {
-      data = await res.json()
-    } catch {
-      data = { status: 'not_available', initialized: false, message: 'Failed to parse response' }
-    }
-
-    return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+    return await relayJson(res, { status: 'not_available', initialized: false, message: 'Failed to parse response' })
   } catch (err: any) {
-    return NextResponse.json(
-      { 
-        status: 'not_available',
-        initialized: false,
-        message: 'Storage status check failed',
-        success: false, 
-        error: String(err?.message || err) 
-      },
-      { status: 500 }
-    )
+    return proxyError(err, {
+      status: 'not_available',
+      initialized: false,
+      message: 'Storage status check failed'
+    })
   }
 }
@@ -1,27 +1,52 @@
+import { revalidateTag } from 'next/cache'
 import { NextResponse } from 'next/server'
-import { apiUrls } from '@/lib/config'
+import { config, apiUrls, dashboardCache } from '@/lib/config'
+import { relayJson, proxyError } from '@/lib/proxy'
 
 // Server-side proxy to avoid browser CORS while calling the Railway API
 export async function POST(req: Request) {
-  try {
-    const form = await req.formData()
-    const upstream = apiUrls.upload
-    const res = await fetch(upstream, { method: 'POST', body: form })
+  const contentLength = Number(req.headers.get('content-length') || 0)
+  if (contentLength > config.maxUploadBytes) return uploadTooLarge()
 
-    let data: any = null
-    try {
-      data = await res.json()
-    } catch {
-      data = { message: 'Upstream returned non-JSON' }
+  // Count bytes as they stream upstream so bodies without a Content-Length are capped too
+  let received = 0
+  let overLimit = false
+  const body = req.body?.pipeThrough(new TransformStream<Uint8Array, Uint8Array>({
+    transform(chunk, controller) {
+      received += chunk.byteLength
+      if (received > config.maxUploadBytes) {
+        overLimit = true
+        controller.error(new Error('Upload too large'))
+      } else {
+        controller.enqueue(chunk)
+      }
     }
+  }))
 
-    return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+  try {
+    // Stream the multipart body straight through rather than buffering and re-encoding it with formData()
+    const contentType = req.headers.get('content-type')
+    const init: RequestInit & { duplex: 'half' } = {
+      method: 'POST',
+      headers: contentType ? { 'Content-Type': contentType } : undefined,
+      body,
+      duplex: 'half'
+    }
+    const res = await fetch(apiUrls.upload, init)
+    if (res.ok) {
+      for (const tag of dashboardCache.files.tags) revalidateTag(tag)
+    }
+
+    return await relayJson(res, { message: 'Upstream returned non-JSON' })
   } catch (err: any) {
-    return NextResponse.json(
-      { message: 'Proxy error', files_processed: [], next_step: '', success: false, error: String(err?.message || err) },
-      { status: 500 }
-    )
+    if (overLimit) return uploadTooLarge()
+    return proxyError(err, { message: 'Proxy error', files_processed: [], next_step: '' })
   }
 }
 
-
+function uploadTooLarge() {
+  return NextResponse.json(
+    { message: 'Upload too large', files_processed: [], next_step: '', success: false, error: `Request body exceeds ${config.maxUploadBytes} bytes` },
+    { status: 413 }
+  )
+}
@@ -4,8 +4,8 @@ import React from 'react'
 import { useUploadContext } from '@/lib/upload-context'
 import { FileDropzone } from '@/components/file-dropzone'
 import { FileSlot } from '@/components/file-slot'
-import { validateCarrierCsv, validateErpCsv, CARRIER_REQUIRED_COLUMNS, ERP_REQUIRED_COLUMNS } from '@/lib/validators'
-import { CheckCircle2, AlertCircle, Zap, Brain } from 'lucide-react'
+import { validateCarrierCsv, validateErpCsv, validateCsvColumnSets, CARRIER_REQUIRED_COLUMNS, ERP_REQUIRED_COLUMNS } from '@/lib/validators'
+import { Zap, Brain } from 'lucide-react'
 import { Stepper as StepperComp } from '@/components/stepper'
 
 export default function Page2() {
@@ -15,8 +15,9 @@ export default function Page2() {
     const newErrors: Record<string, string | null> = {}
     for (const f of files) {
       const text = await f.text()
-      const isCarrier = (await validateCarrierCsv(text)).valid
-      const isErp = (await validateErpCsv(text)).valid
+      const result = validateCsvColumnSets(text)
+      const isCarrier = result.carrier.valid
+      const isErp = result.erp.valid
 
       if (isCarrier && !isErp) {
         setCarrierCsv(f)
@@ -122,18 +123,4 @@ export default function Page2() {
   )
 }
 
-function Item({ label, file, error }: { label: string, file?: string, error?: string | null }) {
-  const ok = !!file && !error
-  return (
-    <div className="flex items-center justify-between rounded-md border bg-white px-3 py-2">
-      <div className="text-sm">
-        <div className="font-medium">{label}</div>
-        <div className="text-xs text-slate-500">{file || 'No file selected'}</div>
-        {error && <div className="text-xs text-red-600">{error}</div>}
-      </div>
-      {ok ? <CheckCircle2 className="h-4 w-4 text-emerald-600"/> : error ? <AlertCircle className="h-4 w-4 text-red-600"/> : null}
-    </div>
-  )
-}
-
 
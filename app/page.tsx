@@ -1,11 +1,11 @@
 "use client"
 import Link from 'next/link'
-import { FileUp, UploadCloud, CheckCircle2, AlertCircle, Zap, Brain } from 'lucide-react'
+import { FileUp, Zap, Brain } from 'lucide-react'
 import React from 'react'
 import { useUploadContext } from '@/lib/upload-context'
 import { FileDropzone } from '@/components/file-dropzone'
 import { FileSlot } from '@/components/file-slot'
-import { validateEdi850, validateEdi856 } from '@/lib/validators'
+import { validateEdi850, validateEdi856, validateEdiTransactionSets } from '@/lib/validators'
 import { Stepper as StepperComp } from '@/components/stepper'
 
 export default function Page1() {
@@ -15,8 +15,9 @@ export default function Page1() {
     const newErrors: Record<string, string | null> = {}
     for (const f of files) {
       const text = await f.text()
-      const is850 = validateEdi850(text).valid
-      const is856 = validateEdi856(text).valid
+      const result = validateEdiTransactionSets(text)
+      const is850 = result.edi850.valid
+      const is856 = result.edi856.valid
 
       if (is850 && !is856) {
         setEdi850(f)
@@ -130,22 +131,4 @@ function Header() {
 
 function Stepper({ current }: { current: 0 | 1 | 2 }) { return <StepperComp current={current} /> }
 
-function RequiredItem({ label, file, error }: { label: string, file?: string, error?: string | null }) {
-  const stateIcon = error ? <AlertCircle className="h-4 w-4 text-red-600"/> : file ? <CheckCircle2 className="h-4 w-4 text-emerald-600"/> : <UploadCloud className="h-4 w-4 text-slate-400"/>
-  const stateText = error ? 'Invalid' : file ? 'Ready' : 'Required'
-  return (
-    <div className="flex items-center justify-between rounded-md border bg-white px-3 py-2">
-      <div className="text-sm">
-        <div className="font-medium">{label}</div>
-        <div className="text-xs text-slate-500">{file || 'No file selected'}</div>
-        {error && <div className="text-xs text-red-600">{error}</div>}
-      </div>
-      <div className="flex items-center gap-2 text-xs text-slate-500">
-        {stateIcon}
-        <span>{stateText}</span>
-      </div>
-    </div>
-  )
-}
-
 
@@ -9,7 +9,9 @@ export const config = {
     incidents: '/storage/incidents',
     order: '/storage/order',
     health: '/health'
-  }
+  },
+  // Uploads larger than this are rejected by the proxy before anything is sent upstream
+  maxUploadBytes: 50 * 1024 * 1024
 }
 
 // Helper function to build full API URLs
@@ -17,13 +19,26 @@ export const buildApiUrl = (endpoint: string) => {
   return `${config.backendUrl}${endpoint}`
 }
 
-// API endpoints for the frontend
+// API endpoints for the frontend, resolved once from config.apiEndpoints
 export const apiUrls = {
-  upload: buildApiUrl('/upload'),
-  analyze: buildApiUrl('/analyze'),
-  files: buildApiUrl('/files'),
-  storageStatus: buildApiUrl('/storage/status'),
-  incidents: buildApiUrl('/storage/incidents'),
-  order: buildApiUrl('/storage/order'),
-  health: buildApiUrl('/health')
+  upload: buildApiUrl(config.apiEndpoints.upload),
+  analyze: buildApiUrl(config.apiEndpoints.analyze),
+  files: buildApiUrl(config.apiEndpoints.files),
+  storageStatus: buildApiUrl(config.apiEndpoints.storageStatus),
+  incidents: buildApiUrl(config.apiEndpoints.incidents),
+  order: buildApiUrl(config.apiEndpoints.order),
+  health: buildApiUrl(config.apiEndpoints.health)
+}
+
+// Data-cache settings for proxied storage reads. /api/analyze revalidates these
+// tags after a successful run so a newly stored incident shows up immediately.
+export const storageCache = {
+  incidents: { revalidate: 30, tags: ['storage-incidents'] },
+  order: { revalidate: 60, tags: ['storage-order'] }
+}
+
+// Short-lived cache for the dashboard's file listing. /api/upload and /api/analyze
+// revalidate the files tag so uploaded and processed files are listed immediately.
+export const dashboardCache = {
+  files: { revalidate: 10, tags: ['files'] }
 }
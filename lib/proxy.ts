@@ -0,0 +1,22 @@
+import { NextResponse } from 'next/server'
+
+// Relays an upstream Railway response to the browser, tagging it with `success`
+// and substituting `fallback` when the upstream body is not JSON
+export async function relayJson(res: Response, fallback: Record<string, any>) {
+  let data: any = null
+  try {
+    data = await res.json()
+  } catch {
+    data = fallback
+  }
+
+  return NextResponse.json({ ...data, success: res.ok }, { status: res.status })
+}
+
+// Error envelope returned when the upstream request itself fails
+export function proxyError(err: any, body: Record<string, any>) {
+  return NextResponse.json(
+    { ...body, success: false, error: String(err?.message || err) },
+    { status: 500 }
+  )
+}
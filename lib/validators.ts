@@ -3,25 +3,41 @@ import Papa from 'papaparse'
 export type ValidationResult = { valid: boolean; message?: string }
 
 // Very lightweight heuristics for EDI 850 and 856 (X12). Real-world parsers are complex.
-export function validateEdi850(text: string): ValidationResult {
-  // Must include ISA, GS, ST*850, and SE/GE/IEA control segments
-  if (!/\bISA\b/.test(text)) return { valid: false, message: 'Missing ISA segment' }
-  if (!/\bGS\b/.test(text)) return { valid: false, message: 'Missing GS segment' }
-  if (!/\bST\*?850\b/.test(text)) return { valid: false, message: 'This is not an 850 transaction set' }
-  if (!/\bSE\b/.test(text) || !/\bGE\b/.test(text) || !/\bIEA\b/.test(text)) {
+// Every control segment and transaction set header is matched by one alternation,
+// so the text is scanned once instead of once per segment.
+const EDI_TOKEN_RE = /\b(ISA|GS|SE|GE|IEA)\b|\bST\*?(850|856)\b/g
+
+function scanEdiTokens(text: string): Set<string> {
+  const tokens = new Set<string>()
+  for (const m of text.matchAll(EDI_TOKEN_RE)) tokens.add(m[1] ?? `ST${m[2]}`)
+  return tokens
+}
+
+function checkEdiTokens(tokens: Set<string>, transactionSet: '850' | '856'): ValidationResult {
+  // Must include ISA, GS, ST*<set>, and SE/GE/IEA control segments
+  if (!tokens.has('ISA')) return { valid: false, message: 'Missing ISA segment' }
+  if (!tokens.has('GS')) return { valid: false, message: 'Missing GS segment' }
+  if (!tokens.has(`ST${transactionSet}`)) {
+    return { valid: false, message: `This is not an ${transactionSet} transaction set` }
+  }
+  if (!tokens.has('SE') || !tokens.has('GE') || !tokens.has('IEA')) {
     return { valid: false, message: 'Missing control trailer segments (SE/GE/IEA)' }
   }
   return { valid: true }
 }
 
+export function validateEdi850(text: string): ValidationResult {
+  return checkEdiTokens(scanEdiTokens(text), '850')
+}
+
 export function validateEdi856(text: string): ValidationResult {
-  if (!/\bISA\b/.test(text)) return { valid: false, message: 'Missing ISA segment' }
-  if (!/\bGS\b/.test(text)) return { valid: false, message: 'Missing GS segment' }
-  if (!/\bST\*?856\b/.test(text)) return { valid: false, message: 'This is not an 856 transaction set' }
-  if (!/\bSE\b/.test(text) || !/\bGE\b/.test(text) || !/\bIEA\b/.test(text)) {
-    return { valid: false, message: 'Missing control trailer segments (SE/GE/IEA)' }
-  }
-  return { valid: true }
+  return checkEdiTokens(scanEdiTokens(text), '856')
+}
+
+// Classifies a dropped file against both transaction sets from one token scan
+export function validateEdiTransactionSets(text: string): { edi850: ValidationResult; edi856: ValidationResult } {
+  const tokens = scanEdiTokens(text)
+  return { edi850: checkEdiTokens(tokens, '850'), edi856: checkEdiTokens(tokens, '856') }
 }
 
 // CSV validators
@@ -52,12 +68,30 @@ export async function validateErpCsv(csv: string): Promise<ValidationResult> {
 }
 
 async function validateCsvHasColumns(csv: string, requiredColumns: string[], label: string): Promise<ValidationResult> {
-  const parsed = Papa.parse(csv, { header: true, skipEmptyLines: true })
-  if (parsed.errors?.length) {
-    return { valid: false, message: `${label} CSV parse error: ${parsed.errors[0].message}` }
+  return checkCsvColumns(parseCsvHeader(csv), requiredColumns, label)
+}
+
+// Classifies a dropped CSV against both column sets from a single parse of the file
+export function validateCsvColumnSets(csv: string): { carrier: ValidationResult; erp: ValidationResult } {
+  const header = parseCsvHeader(csv)
+  return {
+    carrier: checkCsvColumns(header, CARRIER_REQUIRED_COLUMNS, 'Carrier'),
+    erp: checkCsvColumns(header, ERP_REQUIRED_COLUMNS, 'ERP')
   }
-  const headers = (parsed.meta.fields || []).map(h => normalize(h))
-  const missing = requiredColumns.filter(c => !headers.includes(normalize(c)))
+}
+
+type CsvHeader = { headers: Set<string>; error?: string }
+
+function parseCsvHeader(csv: string): CsvHeader {
+  const parsed = Papa.parse(csv, { header: true, skipEmptyLines: true })
+  if (parsed.errors?.length) return { headers: new Set(), error: parsed.errors[0].message }
+  // Kept as a Set so each required column is an exact-match lookup rather than a scan
+  return { headers: new Set((parsed.meta.fields || []).map(h => normalize(h))) }
+}
+
+function checkCsvColumns({ headers, error }: CsvHeader, requiredColumns: string[], label: string): ValidationResult {
+  if (error) return { valid: false, message: `${label} CSV parse error: ${error}` }
+  const missing = requiredColumns.filter(c => !headers.has(normalize(c)))
   if (missing.length) return { valid: false, message: `${label} CSV missing columns: ${missing.join(', ')}` }
   return { valid: true }
 }